@@ -4,21 +4,29 @@ import asyncio
 import json
 import logging
 import os
+import random
+from collections import deque
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
 from urllib.parse import urlparse, urlunparse
 
 import aiohttp
+import orjson
 from homeassistant.components.persistent_notification import async_create as pn_create
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_time_interval, async_track_time_change
 from homeassistant.helpers.storage import Store
 
 from .const import (
     DOMAIN,
+    SIGNAL_KEG_UPDATE,
+    SIGNAL_DISPLAY_UNITS,
     CONF_WS_URL,
     CONF_EMPTY_WEIGHT,
     CONF_DEFAULT_FULL_WEIGHT,
@@ -29,6 +37,7 @@ from .const import (
     DEFAULT_FULL_WEIGHT,
     DEFAULT_POUR_THRESHOLD,
 )
+from .helpers import prefs_data, refresh_display_units_cache, validate_display_units
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -39,10 +48,16 @@ PLATFORMS = ["sensor", "select", "number", "text", "date"]
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 KG_TO_OZ = 35.274
-REST_POLL_SECONDS = 10
-WS_PING_SEC = 30
+REST_POLL_SECONDS = 60
+WS_FRESH_SEC = 60
+WS_HEARTBEAT_SEC = 20
+WS_BACKOFF_MIN_SEC = 1.0
+WS_BACKOFF_MAX_SEC = 60.0
 DATA_STALE_SEC = 45
 DEVICES_REFRESH_SEC = 60
+HISTORY_SAVE_DELAY_SEC = 30
+PREFS_SAVE_COOLDOWN_SEC = 1.0
+NORMALIZE_IN_EXECUTOR_MIN = 50
 LAST_UPDATE_KEY = "last_update_ts"
 
 DEVICES_UPDATE_EVENT = f"{DOMAIN}_devices_update"
@@ -67,6 +82,10 @@ except Exception:  # pragma: no cover - optional import
     WATER_DENSITY_KG_PER_L = 0.998
 
 
+# Keg id normalization in one pass: ASCII upper -> lower, space -> underscore
+_ID_TABLE = str.maketrans({" ": "_", **{chr(c): chr(c + 32) for c in range(0x41, 0x5B)}})
+
+
 def _coerce_float(val: Any, default: float = 0.0) -> float:
     try:
         return float(val)
@@ -76,7 +95,7 @@ def _coerce_float(val: Any, default: float = 0.0) -> float:
 
 def _normalize_keg_dict(keg: dict) -> dict:
     """Normalize keg dict from WS/REST payloads into a common structure."""
-    keg_id = str(keg.get("id", "unknown")).lower().replace(" ", "_")
+    keg_id = str(keg.get("id", "unknown")).translate(_ID_TABLE)
     weight = _coerce_float(keg.get("weight"))
     temp = keg.get("temperature")
     temp = _coerce_float(temp) if temp is not None else None
@@ -93,6 +112,11 @@ def _normalize_keg_dict(keg: dict) -> dict:
     }
 
 
+def _normalize_keg_list(kegs: List[dict]) -> List[dict]:
+    """Normalize every keg dict of a WS/REST payload."""
+    return [_normalize_keg_dict(keg) for keg in kegs]
+
+
 def _rest_base_from_ws(ws: str) -> str:
     """Build http(s) base URL from ws:// or wss://."""
     u = urlparse(ws)
@@ -128,23 +152,43 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Per-keg full weight overrides (JSON of id->kg)
         per_keg_full: Dict[str, float] = {}
-        raw_mapping = opts.get(CONF_PER_KEG_FULL)
-        if raw_mapping:
+        raw_mapping = (opts.get(CONF_PER_KEG_FULL) or "").strip()
+        if raw_mapping and raw_mapping != "{}":
             try:
                 per_keg_full = {
-                    str(k).lower().replace(" ", "_"): float(v)
+                    str(k).translate(_ID_TABLE): float(v)
                     for k, v in json.loads(raw_mapping).items()
                 }
             except Exception as e:
                 _LOGGER.warning("%s: Invalid per_keg_full mapping: %s", DOMAIN, e)
 
         hass.data.setdefault(DOMAIN, {})
-        history_store: Store = Store(hass, 1, f"{DOMAIN}_history")
-        prefs_store: Store = Store(hass, 1, f"{DOMAIN}_prefs")
+        # One pooled HTTP session for REST, calibration and the WebSocket
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=10, keepalive_timeout=75)
+        )
+        # Closed on unload, and also if anything below fails setup
+        entry.async_on_unload(session.close)
+        # History can hold MAX_LOG_ENTRIES records; JSON-encode it in the executor.
+        # Store calls data_func on the executor thread too, so callers hand it a
+        # list copied on the loop; the records in it are never mutated afterwards.
+        history_store: Store = Store(
+            hass, 1, f"{DOMAIN}_history", serialize_in_event_loop=False
+        )
+        # keg_config grows with every keg; encode prefs in the executor too.
+        # prefs_data() hands the store copies, not the live dicts.
+        prefs_store: Store = Store(
+            hass, 1, f"{DOMAIN}_prefs", serialize_in_event_loop=False
+        )
+
+        # REST endpoints never change for an entry; build them once
+        rest_base = _rest_base_from_ws(ws_url)
 
         # Main runtime state for this config entry
         state: Dict[str, Any] = {
             "ws_url": ws_url,
+            "rest_base": rest_base,
+            "rest_urls": (f"{rest_base}/api/kegs", f"{rest_base}/api/kegs/"),
             "empty_weight": empty_weight,
             "default_full": default_full,
             "pour_threshold": pour_threshold,
@@ -154,7 +198,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "computed_full_from_sg": computed_full_from_sg,
             "kegs": {},          # runtime per-keg stats
             "data": {},          # values exposed to entities
-            "history": [],
+            "created_entities": {},  # platform -> keg_ids that have entities
+            "history": deque(maxlen=MAX_LOG_ENTRIES),
             "devices": [],
             "display_units": {   # may be overridden by prefs below
                 "weight": "kg",
@@ -169,15 +214,31 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             "keg_config": {},
             "history_store": history_store,
             "prefs_store": prefs_store,
+            "session": session,
+            "ws_task": None,
+            "ws_connected": False,
+            "last_ws_msg": None,
             LAST_UPDATE_KEY: None,
         }
 
         hass.data[DOMAIN][entry.entry_id] = state
 
+        async def _save_prefs() -> None:
+            await prefs_store.async_save(prefs_data(state))
+
+        # Coalesces bursts of unit/config edits into one prefs write
+        state["prefs_debouncer"] = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=PREFS_SAVE_COOLDOWN_SEC,
+            immediate=False,
+            function=_save_prefs,
+        )
+
         # ---- load history from storage
         loaded_history = await history_store.async_load()
         if isinstance(loaded_history, list):
-            state["history"] = loaded_history
+            state["history"] = deque(loaded_history, maxlen=MAX_LOG_ENTRIES)
             _LOGGER.info("%s: Loaded %d pour records", DOMAIN, len(state["history"]))
 
         # ---- load prefs (display_units + keg_config) from storage
@@ -185,48 +246,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if isinstance(loaded_prefs, dict):
             du = loaded_prefs.get("display_units")
             if isinstance(du, dict):
-                w = du.get("weight")
-                t = du.get("temp")
-                p = du.get("pour")
-                if w in ("kg", "lb"):
-                    state["display_units"]["weight"] = w
-                if t in ("°C", "°F"):
-                    state["display_units"]["temp"] = t
-                if p in ("oz", "ml"):
-                    state["display_units"]["pour"] = p
+                state["display_units"] = validate_display_units(du)
             keg_cfg = loaded_prefs.get("keg_config")
             if isinstance(keg_cfg, dict):
                 norm_cfg: Dict[str, Dict[str, Any]] = {}
                 for k, v in keg_cfg.items():
-                    keg_id = str(k).lower().replace(" ", "_")
+                    keg_id = str(k).translate(_ID_TABLE)
                     if isinstance(v, dict):
                         norm_cfg[keg_id] = v
                 state["keg_config"] = norm_cfg
 
+        refresh_display_units_cache(state)
+
         # ---------- REST helpers
 
         async def fetch_kegs() -> List[Dict[str, Any]]:
             """GET /api/kegs (list or {'kegs':[...]})"""
             try:
-                base = _rest_base_from_ws(ws_url)
-                urls = (f"{base}/api/kegs", f"{base}/api/kegs/")
-                async with aiohttp.ClientSession() as http_sess:
-                    for url in urls:
-                        try:
-                            async with http_sess.get(url) as resp:
-                                if resp.status != 200:
-                                    _ = await resp.text()
-                                    continue
-                                try:
-                                    data = await resp.json()
-                                except Exception:
-                                    continue
-                                if isinstance(data, list):
-                                    return data
-                                if isinstance(data, dict) and isinstance(data.get("kegs"), list):
-                                    return data["kegs"]
-                        except Exception as e:
-                            _LOGGER.warning("%s: REST GET failed %s (%s)", DOMAIN, url, e)
+                urls = state["rest_urls"]
+                for url in urls:
+                    try:
+                        async with session.get(url) as resp:
+                            if resp.status != 200:
+                                _ = await resp.text()
+                                continue
+                            try:
+                                data = orjson.loads(await resp.read())
+                            except Exception:
+                                continue
+                            if isinstance(data, list):
+                                kegs = data
+                            elif isinstance(data, dict) and isinstance(data.get("kegs"), list):
+                                kegs = data["kegs"]
+                            else:
+                                continue
+                            if url is not urls[0]:
+                                # Remember the working variant so later polls need one GET
+                                state["rest_urls"] = (url, urls[0])
+                            return kegs
+                    except Exception as e:
+                        _LOGGER.warning("%s: REST GET failed %s (%s)", DOMAIN, url, e)
                 return []
             except Exception as e:
                 _LOGGER.error("%s: fetch_kegs error (outer): %s", DOMAIN, e)
@@ -235,23 +294,22 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         async def fetch_devices() -> list[str]:
             """GET /api/kegs/devices -> list[str]."""
             try:
-                base = _rest_base_from_ws(ws_url)
+                base = state["rest_base"]
                 urls = (f"{base}/api/kegs/devices", f"{base}/api/kegs/devices/")
-                async with aiohttp.ClientSession() as http_sess:
-                    for url in urls:
-                        try:
-                            async with http_sess.get(url) as resp:
-                                if resp.status != 200:
-                                    _ = await resp.text()
-                                    continue
-                                data = await resp.json()
-                                if isinstance(data, list):
-                                    ids = [str(x) for x in data]
-                                    state["devices"] = ids
-                                    hass.bus.async_fire(DEVICES_UPDATE_EVENT, {"ids": ids})
-                                    return ids
-                        except Exception as e:
-                            _LOGGER.debug("%s: REST devices GET failed %s (%s)", DOMAIN, url, e)
+                for url in urls:
+                    try:
+                        async with session.get(url) as resp:
+                            if resp.status != 200:
+                                _ = await resp.text()
+                                continue
+                            data = await resp.json()
+                            if isinstance(data, list):
+                                ids = [str(x) for x in data]
+                                state["devices"] = ids
+                                hass.bus.async_fire(DEVICES_UPDATE_EVENT, {"ids": ids})
+                                return ids
+                    except Exception as e:
+                        _LOGGER.debug("%s: REST devices GET failed %s (%s)", DOMAIN, url, e)
                 return state.setdefault("devices", [])
             except Exception as e:
                 _LOGGER.error("%s: fetch_devices error: %s", DOMAIN, e)
@@ -259,11 +317,41 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # ---------- publisher
 
-        async def _publish_keg(norm: dict) -> None:
-            """Normalize and push one keg's data into integration state."""
+        @callback
+        def _notify_kegs(keg_ids: List[str]) -> None:
+            """Announce keg updates: one bus event for platform setup, a signal per keg."""
+            if not keg_ids:
+                return
+            hass.bus.async_fire(f"{DOMAIN}_update", {"keg_ids": keg_ids})
+            for keg_id in keg_ids:
+                async_dispatcher_send(hass, SIGNAL_KEG_UPDATE.format(keg_id))
+
+        def _frame_key(norm: dict, existing: Dict[str, Any] | None) -> tuple | None:
+            """Inputs that decide a keg's published values (None until first publish)."""
+            if existing is None:
+                return None
+            return (
+                norm["weight"],
+                norm["temperature"],
+                norm["full_weight"],
+                norm["name"],
+                existing.get("full_weight"),
+                existing.get("weight_calibrate"),
+                existing.get("temperature_calibrate"),
+                existing.get("daily_consumed"),
+                state.get("smoothing_alpha"),
+                state.get("noise_deadband_kg"),
+            )
+
+        async def _publish_keg(norm: dict) -> bool:
+            """Push one normalized keg into integration state; True if its values changed.
+
+            Callers announce the changed kegs together via _notify_kegs.
+            """
             keg_id = norm["keg_id"]
             weight_raw = norm["weight"]
             temp = norm["temperature"]
+            now = datetime.now(timezone.utc)
 
             # ---------- INITIALIZE PER-KEG RUNTIME STATE ----------
             info = state["kegs"].get(keg_id)
@@ -284,6 +372,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                     "recent_weights": [],
                 }
 
+            # ---------- FAST PATH: repeated frame, filter + median window settled ----------
+            existing = state["data"].get(keg_id)
+            frame_key = _frame_key(norm, existing)
+            if info.get("settled") and frame_key == info.get("last_frame_key"):
+                state[LAST_UPDATE_KEY] = now
+                return False
+
             # ---------- POUR DETECTION ----------
             prev_weight_raw = info.get("last_weight_raw", weight_raw)
             raw_delta = prev_weight_raw - weight_raw
@@ -310,8 +405,17 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
                 display_weight = filtered
                 info["filtered_weight"] = filtered
+                # Identical frames can't move the output any further once the
+                # median window is full of this weight (appending another copy
+                # leaves it unchanged), so the fast path may skip them
+                info["settled"] = (
+                    filtered == previous_filtered
+                    and len(recent) == 5
+                    and recent.count(weight_raw) == 5
+                )
             else:
                 info["filtered_weight"] = weight_raw
+                info["settled"] = False
 
             info["last_weight"] = display_weight
 
@@ -320,23 +424,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 delta_kg = round(raw_delta, 2)
                 delta_oz = round(delta_kg * KG_TO_OZ, 1)
                 info["last_pour"] = delta_oz
-                info["last_pour_time"] = datetime.now(timezone.utc)
+                info["last_pour_time"] = now
                 info["daily_consumed"] += delta_oz
 
                 state["history"].append({
-                    "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S %Z"),
+                    "timestamp": now.isoformat(sep=" ", timespec="seconds"),
                     "keg": keg_id,
                     "pour_oz": delta_oz,
                     "weight_before_kg": round(prev_weight_raw, 2),
                     "weight_after_kg": round(weight_raw, 2),
                     "temperature_c": temp,
                 })
-                if len(state["history"]) > MAX_LOG_ENTRIES:
-                    state["history"].pop(0)
-                await state["history_store"].async_save(state["history"][-MAX_LOG_ENTRIES:])
+                # Coalesce bursts of pours into one write; on_stop does the final flush.
+                # Snapshot here on the loop: Store runs data_func in the executor.
+                history_snapshot = list(state["history"])
+                state["history_store"].async_delay_save(
+                    lambda: history_snapshot, HISTORY_SAVE_DELAY_SEC
+                )
 
             # ---------- APPLY MANUAL OVERRIDES FROM NUMBER ENTITIES ----------
-            existing = state["data"].get(keg_id, {})
+            existing = state["data"].setdefault(keg_id, {})
 
             # Keep defaults only if no data yet
             if "full_weight" not in existing:
@@ -369,81 +476,131 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 fill_pct = 0.0
             fill_pct = max(0, min(100, fill_pct))
 
-            # ---------- WRITE STATE BACK ----------
-            state["data"][keg_id] = {
-                **existing,
-                "id": keg_id,
-                "name": norm["name"],
-                "weight": round(display_weight, 2),
-                "temperature": round(temp, 1) if temp is not None else None,
-                "full_weight": round(float(fw), 2),
-                "weight_calibrate": override_wc,
-                "temperature_calibrate": override_tc,
-                "daily_consumed": round(info["daily_consumed"], 1),
-                "last_pour": round(info["last_pour"], 1),
-                "fill_percent": round(fill_pct, 1),
-            }
-
-            state[LAST_UPDATE_KEY] = datetime.now(timezone.utc)
+            # ---------- WRITE STATE BACK (in place) ----------
+            changed = False
+            for key, value in (
+                ("id", keg_id),
+                ("name", norm["name"]),
+                ("weight", round(display_weight, 2)),
+                ("temperature", round(temp, 1) if temp is not None else None),
+                ("full_weight", round(float(fw), 2)),
+                ("weight_calibrate", override_wc),
+                ("temperature_calibrate", override_tc),
+                ("daily_consumed", round(info["daily_consumed"], 1)),
+                ("last_pour", round(info["last_pour"], 1)),
+                ("fill_percent", round(fill_pct, 1)),
+            ):
+                if key not in existing or existing[key] != value:
+                    existing[key] = value
+                    changed = True
+
+            info["last_frame_key"] = _frame_key(norm, existing)
+            state[LAST_UPDATE_KEY] = now
 
             if keg_id not in state["devices"]:
                 state["devices"].append(keg_id)
                 hass.bus.async_fire(DEVICES_UPDATE_EVENT, {"ids": list(state["devices"])})
 
-            hass.bus.async_fire(f"{DOMAIN}_update", {"keg_id": keg_id})
+            # Nothing visible changed -> don't wake every listener
+            return changed
 
+        async def _publish_rest_kegs(keg_list: List[dict]) -> None:
+            """Normalize a REST keg list (in the executor when large) and publish it."""
+            if len(keg_list) > NORMALIZE_IN_EXECUTOR_MIN:
+                norms = await hass.async_add_executor_job(_normalize_keg_list, keg_list)
+            else:
+                norms = _normalize_keg_list(keg_list)
+            _notify_kegs([norm["keg_id"] for norm in norms if await _publish_keg(norm)])
 
         # ---------- WebSocket loop
 
+        def _kegs_from_frame(frame: str) -> List[dict]:
+            """Decode one WS text frame into normalized keg dicts."""
+            try:
+                data = orjson.loads(frame)
+            except orjson.JSONDecodeError:
+                return []
+
+            if isinstance(data, list):
+                source = data
+            else:
+                kegs = data.get("kegs")
+                source = kegs if isinstance(kegs, list) else None
+            if not source:
+                return []
+            return _normalize_keg_list(source)
+
         async def connect_websocket() -> None:
-            async with aiohttp.ClientSession() as http_sess:
-                while True:
-                    try:
-                        _LOGGER.info("%s: Connecting WS -> %s", DOMAIN, ws_url)
-                        async with http_sess.ws_connect(ws_url) as ws:
-                            _LOGGER.info("%s: Connected to WS", DOMAIN)
-
-                            async def _pinger() -> None:
-                                while True:
-                                    try:
-                                        await ws.ping()
-                                    except Exception:
+            backoff = WS_BACKOFF_MIN_SEC
+            while True:
+                try:
+                    _LOGGER.info("%s: Connecting WS -> %s", DOMAIN, ws_url)
+                    # heartbeat: aiohttp pings and drops the socket if pongs stop
+                    async with session.ws_connect(ws_url, heartbeat=WS_HEARTBEAT_SEC) as ws:
+                        _LOGGER.info("%s: Connected to WS", DOMAIN)
+                        state["ws_connected"] = True
+                        backoff = WS_BACKOFF_MIN_SEC
+
+                        # Reader pushes frames; the consumer drains everything that is
+                        # already buffered and publishes only the newest payload per keg.
+                        frames: asyncio.Queue[str | None] = asyncio.Queue()
+
+                        async def _reader() -> None:
+                            try:
+                                async for msg in ws:
+                                    if msg.type == aiohttp.WSMsgType.TEXT:
+                                        state["last_ws_msg"] = datetime.now(timezone.utc)
+                                        frames.put_nowait(msg.data)
+                            finally:
+                                frames.put_nowait(None)
+
+                        reader = hass.async_create_task(_reader())
+                        try:
+                            closed = False
+                            while not closed:
+                                batch = [await frames.get()]
+                                while not frames.empty():
+                                    batch.append(frames.get_nowait())
+
+                                latest: Dict[str, dict] = {}
+                                for frame in batch:
+                                    if frame is None:
+                                        closed = True
                                         break
-                                    await asyncio.sleep(WS_PING_SEC)
-
-                            hass.async_create_task(_pinger())
-
-                            async for msg in ws:
-                                if msg.type != aiohttp.WSMsgType.TEXT:
-                                    continue
-                                try:
-                                    data = json.loads(msg.data)
-                                except json.JSONDecodeError:
-                                    continue
-
-                                if isinstance(data, list):
-                                    source = data
-                                else:
-                                    kegs = data.get("kegs")
-                                    source = kegs if isinstance(kegs, list) else None
-                                if not source:
-                                    continue
-
-                                for raw in source:
-                                    norm = _normalize_keg_dict(raw)
-                                    await _publish_keg(norm)
-                    except Exception as e:
-                        _LOGGER.error("%s: WS error: %s", DOMAIN, e)
-                        await asyncio.sleep(10)
+                                    for norm in _kegs_from_frame(frame):
+                                        latest[norm["keg_id"]] = norm
+
+                                _notify_kegs(
+                                    [k for k, norm in latest.items() if await _publish_keg(norm)]
+                                )
+                        finally:
+                            reader.cancel()
+                        state["ws_connected"] = False
+                        # Surface reader errors to the reconnect handler below
+                        await reader
+                except Exception as e:
+                    state["ws_connected"] = False
+                    _LOGGER.error("%s: WS error: %s", DOMAIN, e)
+
+                # Exponential backoff with jitter so flapping networks don't cause
+                # reconnect storms
+                await asyncio.sleep(min(WS_BACKOFF_MAX_SEC, backoff) * (0.5 + random.random()))
+                backoff *= 2
 
         # ---------- REST poll & watchdog
 
         async def rest_poll(_now: datetime | None = None) -> None:
+            # REST is only a fallback while the WebSocket is delivering data
+            last_msg = state["last_ws_msg"]
+            if (
+                state["ws_connected"]
+                and last_msg is not None
+                and (datetime.now(timezone.utc) - last_msg).total_seconds() < WS_FRESH_SEC
+            ):
+                return
             try:
                 new_kegs = await fetch_kegs()
-                for raw in new_kegs:
-                    norm = _normalize_keg_dict(raw)
-                    await _publish_keg(norm)
+                await _publish_rest_kegs(new_kegs)
             except Exception as e:
                 _LOGGER.debug("%s: REST poll error: %s", DOMAIN, e)
 
@@ -461,16 +618,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
                 try:
                     new_kegs = await fetch_kegs()
                     if new_kegs:
-                        for raw in new_kegs:
-                            norm = _normalize_keg_dict(raw)
-                            await _publish_keg(norm)
+                        await _publish_rest_kegs(new_kegs)
                     else:
-                        for keg_id in list(state.get("data", {}).keys()):
-                            hass.bus.async_fire(f"{DOMAIN}_update", {"keg_id": keg_id})
+                        _notify_kegs(list(state.get("data", {})))
                 except Exception as e:
                     _LOGGER.error("%s: watchdog REST poll failed: %s", DOMAIN, e)
-                    for keg_id in list(state.get("data", {}).keys()):
-                        hass.bus.async_fire(f"{DOMAIN}_update", {"keg_id": keg_id})
+                    _notify_kegs(list(state.get("data", {})))
 
         async def _periodic_devices(_now: datetime | None) -> None:
             await fetch_devices()
@@ -478,18 +631,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         async def reset_daily_consumption(_now: datetime | None = None) -> None:
             """Reset daily_consumed for all kegs at local midnight."""
             try:
+                data = state["data"]
+                reset: List[str] = []
                 for keg_id, info in state.get("kegs", {}).items():
-                    # Reset runtime stats
+                    keg_data = data.get(keg_id)
+                    # Nothing poured since the last reset: leave the keg (and its entities) alone
+                    if info["daily_consumed"] == 0.0 and (
+                        keg_data is None or keg_data.get("daily_consumed", 0.0) == 0.0
+                    ):
+                        continue
+
+                    # Reset runtime stats + exposed data
                     info["daily_consumed"] = 0.0
+                    if keg_data is not None:
+                        keg_data["daily_consumed"] = 0.0
 
-                    # Reset exposed data if present
-                    if keg_id in state.get("data", {}):
-                        state["data"][keg_id]["daily_consumed"] = 0.0
-
-                    # Nudge HA entities to update
-                    hass.bus.async_fire(f"{DOMAIN}_update", {"keg_id": keg_id})
+                    reset.append(keg_id)
 
-                _LOGGER.info("%s: daily_consumed reset to 0 for %d kegs", DOMAIN, len(state.get("kegs", {})))
+                # Nudge HA entities to update
+                _notify_kegs(reset)
+                _LOGGER.info("%s: daily_consumed reset to 0 for %d kegs", DOMAIN, len(reset))
             except Exception as e:
                 _LOGGER.error("%s: failed resetting daily_consumed: %s", DOMAIN, e)
 
@@ -497,11 +658,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         async def export_history(call: ServiceCall) -> None:
             path = hass.config.path("www/beer_keg_history.json")
+            # Encode on the loop (cheap with orjson); only file I/O goes to the executor
+            payload = orjson.dumps(list(state["history"]), option=orjson.OPT_INDENT_2)
 
             def _write_export() -> None:
                 os.makedirs(os.path.dirname(path), exist_ok=True)
-                with open(path, "w", encoding="utf-8") as f:
-                    json.dump(state["history"][-MAX_LOG_ENTRIES:], f, indent=2)
+                with open(path, "wb") as f:
+                    f.write(payload)
 
             await hass.async_add_executor_job(_write_export)
             pn_create(
@@ -514,17 +677,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         async def refresh_kegs(call: ServiceCall) -> None:
             new_kegs = await fetch_kegs()
-            for raw in new_kegs:
-                norm = _normalize_keg_dict(raw)
-                await _publish_keg(norm)
+            await _publish_rest_kegs(new_kegs)
             pn_create(hass, f"Refreshed {len(new_kegs)} kegs", title="Beer Keg Refresh")
 
         hass.services.async_register(DOMAIN, "refresh_kegs", refresh_kegs)
 
         async def republish_all(call: ServiceCall) -> None:
             data = state.get("data", {})
-            for keg_id in data.keys():
-                hass.bus.async_fire(f"{DOMAIN}_update", {"keg_id": keg_id})
+            _notify_kegs(list(data))
             pn_create(hass, f"Republished {len(data)} kegs", title="Beer Keg Republish")
 
         hass.services.async_register(DOMAIN, "republish_all", republish_all)
@@ -562,8 +722,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             3) Nothing in data: fall back to select.keg_device + state["data"][keg_id].
             """
 
-            base = _rest_base_from_ws(state["ws_url"])
-            url = f"{base}/api/kegs/calibrate"
+            url = f"{state['rest_base']}/api/kegs/calibrate"
 
             data_state: Dict[str, Dict[str, Any]] = state.get("data", {})
 
@@ -696,11 +855,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             # ---------- 4) POST to Plaato/Open-Plaato server ----------
             try:
-                async with aiohttp.ClientSession() as http_sess:
-                    async with http_sess.post(url, json=payload) as resp:
-                        body = await resp.text()
-                        if resp.status not in (200, 201):
-                            raise RuntimeError(f"HTTP {resp.status}: {body[:200]}")
+                async with session.post(url, json=payload) as resp:
+                    body = await resp.text()
+                    if resp.status not in (200, 201):
+                        raise RuntimeError(f"HTTP {resp.status}: {body[:200]}")
 
                 pn_create(hass, "Calibration saved.", title="Beer Keg")
 
@@ -728,38 +886,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
             or without data, in which case we keep existing settings.
             """
-            weight_unit = call.data.get("weight_unit") or state["display_units"].get("weight", "kg")
-            temp_unit = call.data.get("temp_unit") or state["display_units"].get("temp", "°C")
-            pour_unit = call.data.get("pour_unit") or state["display_units"].get("pour", "oz")
-
-            if weight_unit not in ("kg", "lb"):
-                weight_unit = "kg"
-            if temp_unit not in ("°C", "°F"):
-                temp_unit = "°C"
-            if pour_unit not in ("oz", "ml"):
-                pour_unit = "oz"
-
-            state["display_units"] = {
-                "weight": weight_unit,
-                "temp": temp_unit,
-                "pour": pour_unit,
-            }
+            current = state["display_units"]
+            du = state["display_units"] = validate_display_units({
+                "weight": call.data.get("weight_unit") or current.get("weight"),
+                "temp": call.data.get("temp_unit") or current.get("temp"),
+                "pour": call.data.get("pour_unit") or current.get("pour"),
+            })
+            refresh_display_units_cache(state)
 
             # Persist so it survives reboot (along with keg_config)
-            await state["prefs_store"].async_save(
-                {
-                    "display_units": state["display_units"],
-                    "keg_config": state.get("keg_config", {}),
-                }
-            )
+            await state["prefs_debouncer"].async_call()
 
-            # Notify all keg sensors so they recalc units
-            for keg_id in list(state.get("data", {}).keys()):
-                hass.bus.async_fire(f"{DOMAIN}_update", {"keg_id": keg_id})
+            # Notify all keg sensors so they recalc units, and the unit selects
+            _notify_kegs(list(state.get("data", {})))
+            async_dispatcher_send(hass, SIGNAL_DISPLAY_UNITS)
 
             pn_create(
                 hass,
-                f"Display units set to weight={weight_unit}, temp={temp_unit}, pour={pour_unit}",
+                f"Display units set to weight={du['weight']}, temp={du['temp']}, pour={du['pour']}",
                 title="Beer Keg",
             )
 
@@ -768,17 +912,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         async def on_stop(event) -> None:
             """Save both history and prefs on shutdown."""
             try:
-                await state["history_store"].async_save(state["history"][-MAX_LOG_ENTRIES:])
-                await state["prefs_store"].async_save(
-                    {
-                        "display_units": state["display_units"],
-                        "keg_config": state.get("keg_config", {}),
-                    }
-                )
+                await state["history_store"].async_save(list(state["history"]))
+                state["prefs_debouncer"].async_cancel()
+                await state["prefs_store"].async_save(prefs_data(state))
             except Exception as e:  # pragma: no cover - best effort
                 _LOGGER.warning("%s: failed to persist state on stop: %s", DOMAIN, e)
+            await _async_close_session(state)
 
-        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, on_stop)
+        # Tied to the entry so a reloaded entry's stale closure can't overwrite
+        # history at shutdown
+        entry.async_on_unload(
+            hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, on_stop)
+        )
 
         # ---------- Start after HA is running
 
@@ -789,20 +934,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             try:
                 await fetch_devices()
                 initial = await fetch_kegs()
-                for raw in initial:
-                    norm = _normalize_keg_dict(raw)
-                    await _publish_keg(norm)
+                await _publish_rest_kegs(initial)
                 _LOGGER.info("%s: Initial REST refresh found %d kegs", DOMAIN, len(initial))
             except Exception as e:
                 _LOGGER.warning("%s: Initial refresh failed: %s", DOMAIN, e)
 
-            hass.async_create_task(connect_websocket())
-            async_track_time_interval(hass, rest_poll, timedelta(seconds=REST_POLL_SECONDS))
-            async_track_time_interval(hass, watchdog, timedelta(seconds=10))
-            async_track_time_interval(hass, _periodic_devices, timedelta(seconds=DEVICES_REFRESH_SEC))
+            state["ws_task"] = hass.async_create_task(connect_websocket())
+            entry.async_on_unload(
+                async_track_time_interval(hass, rest_poll, timedelta(seconds=REST_POLL_SECONDS))
+            )
+            entry.async_on_unload(
+                async_track_time_interval(hass, watchdog, timedelta(seconds=10))
+            )
+            entry.async_on_unload(
+                async_track_time_interval(hass, _periodic_devices, timedelta(seconds=DEVICES_REFRESH_SEC))
+            )
 
-             # Reset daily_consumed at local midnight
-            async_track_time_change(hass, reset_daily_consumption, hour=0, minute=0, second=0)
+            # Reset daily_consumed at local midnight
+            entry.async_on_unload(
+                async_track_time_change(hass, reset_daily_consumption, hour=0, minute=0, second=0)
+            )
             
             _LOGGER.info("%s: started background tasks", DOMAIN)
 
@@ -819,10 +970,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         return False
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate an older config entry to the current version."""
+    if entry.version > 1:
+        # Downgrade from a future version
+        return False
+
+    if entry.minor_version < 2:
+        # 1.2: the fill_level sensor (duplicate of fill_percent) is no longer
+        # created; drop its registry entries once
+        ent_reg = er.async_get(hass)
+        for reg_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+            if reg_entry.domain == "sensor" and reg_entry.unique_id.endswith("_fill_level"):
+                ent_reg.async_remove(reg_entry.entity_id)
+        hass.config_entries.async_update_entry(entry, minor_version=2)
+
+    _LOGGER.debug("%s: migrated entry to %s.%s", DOMAIN, entry.version, entry.minor_version)
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     state = hass.data.get(DOMAIN, {}).get(entry.entry_id)
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded and state is not None:
+        # Write out any edit still waiting on the prefs debouncer, and pours
+        # still waiting on the delayed history save
+        state["prefs_debouncer"].async_shutdown()
+        await state["prefs_store"].async_save(prefs_data(state))
+        await state["history_store"].async_save(list(state["history"]))
+        await _async_close_session(state)
         hass.data[DOMAIN].pop(entry.entry_id, None)
     return unloaded
+
+
+async def _async_close_session(state: Dict[str, Any]) -> None:
+    """Stop the WebSocket task and close the shared HTTP session."""
+    ws_task = state.get("ws_task")
+    if ws_task is not None:
+        ws_task.cancel()
+        state["ws_task"] = None
+    session = state.get("session")
+    if session is not None and not session.closed:
+        await session.close()
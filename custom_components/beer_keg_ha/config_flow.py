@@ -12,6 +12,8 @@ STEP_USER_SCHEMA = vol.Schema({ vol.Required(CONF_WS_URL): str })
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
+    # 1.2: retired the duplicate fill_level sensor (see async_migrate_entry)
+    MINOR_VERSION = 2
 
     async def async_step_user(self, user_input=None) -> FlowResult:
         if user_input is not None:
@@ -1,5 +1,13 @@
+from types import MappingProxyType
+from typing import Any, Mapping
+
 DOMAIN = "beer_keg_ha"
 
+# Per-keg dispatcher signal; format with the keg_id
+SIGNAL_KEG_UPDATE = DOMAIN + "_update_{}"
+# Dispatcher signal for display unit changes
+SIGNAL_DISPLAY_UNITS = f"{DOMAIN}_display_units"
+
 # Config keys
 CONF_WS_URL = "ws_url"
 CONF_EMPTY_WEIGHT = "empty_weight"
@@ -22,3 +30,6 @@ WATER_DENSITY_KG_PER_L = 0.998
 
 # History
 MAX_LOG_ENTRIES = 500
+
+# Shared read-only stand-in for a keg with no data/config yet
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
@@ -2,15 +2,18 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict, List, Set
 
 from homeassistant.components.date import DateEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING, SIGNAL_KEG_UPDATE
+from .helpers import KegUpdateMixin, keg_ids_from_event, new_keg_filter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,6 +33,18 @@ DATE_TYPES: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# DATE_TYPES flattened once at import: (date_type, key, name)
+DATE_SPECS = tuple((k, m["key"], m["name"]) for k, m in DATE_TYPES.items())
+
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(raw: str) -> date | None:
+    """Parse a stored ISO date; stored values rarely change between reads."""
+    try:
+        return date.fromisoformat(raw)
+    except ValueError:
+        return None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -38,38 +53,36 @@ async def async_setup_entry(
 ) -> None:
     """Set up keg date entities."""
     state = hass.data[DOMAIN][entry.entry_id]
-    created: Set[str] = state.setdefault("created_date_kegs", set())
-
-    entities: List[DateEntity] = []
-
-    def create_for(keg_id: str) -> None:
-        if keg_id in created:
-            return
-        for date_type in DATE_TYPES.keys():
-            entities.append(BeerKegDateEntity(hass, entry, keg_id, date_type))
-        created.add(keg_id)
-
-    for keg_id in list(state.get("data", {}).keys()):
-        create_for(keg_id)
+    created: Set[str] = state["created_entities"].setdefault("date", set())
+
+    def create_for(keg_ids) -> None:
+        # All new kegs in one update event are added in a single batch
+        new_ents: List[DateEntity] = []
+        for keg_id in keg_ids:
+            if keg_id in created:
+                continue
+            for spec in DATE_SPECS:
+                new_ents.append(BeerKegDateEntity(hass, entry, keg_id, *spec))
+            created.add(keg_id)
+        if new_ents:
+            async_add_entities(new_ents, True)
 
-    async_add_entities(entities, True)
+    # Existing kegs
+    create_for(state["data"])
 
     @callback
     def _on_update(event) -> None:
-        keg_id = (event.data or {}).get("keg_id")
-        if keg_id and keg_id not in created:
-            new_ents: List[DateEntity] = []
-            for date_type in DATE_TYPES.keys():
-                new_ents.append(BeerKegDateEntity(hass, entry, keg_id, date_type))
-            created.add(keg_id)
-            async_add_entities(new_ents, True)
+        """Create entities when new kegs appear."""
+        create_for(keg_ids_from_event(event.data))
 
     entry.async_on_unload(
-        hass.bus.async_listen(PLATFORM_EVENT, _on_update)
+        hass.bus.async_listen(
+            PLATFORM_EVENT, _on_update, event_filter=new_keg_filter(created)
+        )
     )
 
 
-class BeerKegDateEntity(DateEntity):
+class BeerKegDateEntity(KegUpdateMixin, DateEntity):
     """Per-keg date entity backed by keg_config + prefs_store."""
 
     _attr_should_poll = False
@@ -80,6 +93,8 @@ class BeerKegDateEntity(DateEntity):
         entry: ConfigEntry,
         keg_id: str,
         date_type: str,
+        key: str,
+        name: str,
     ) -> None:
         self.hass = hass
         self.entry = entry
@@ -87,19 +102,18 @@ class BeerKegDateEntity(DateEntity):
         self.date_type = date_type
 
         self._state_ref: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
-        meta = DATE_TYPES[date_type]
-        self._key = meta["key"]
+        # state["data"] / state["keg_config"] are settled before platform
+        # setup and only mutated in place afterwards
+        self._data: Dict[str, Dict[str, Any]] = self._state_ref["data"]
+        self._keg_cfg: Dict[str, Dict[str, Any]] = self._state_ref["keg_config"]
+        self._key = key
 
         short_id = keg_id[:4]
 
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{keg_id}_date_{date_type}"
-        self._attr_name = f"Keg {short_id} {meta['name']}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        short_id = self.keg_id[:4]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_{self.keg_id}")},
+        self._attr_name = f"Keg {short_id} {name}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_{keg_id}")},
             name=f"Beer Keg {short_id}",
             manufacturer="Beer Keg",
             model="WebSocket + REST",
@@ -108,21 +122,15 @@ class BeerKegDateEntity(DateEntity):
     @property
     def native_value(self) -> date | None:
         """Return a Python date from stored ISO string."""
-        domain_state = self._state_ref
-        keg_cfg: Dict[str, Dict[str, Any]] = domain_state.setdefault("keg_config", {})
-        cfg = keg_cfg.get(self.keg_id, {})
-        raw = cfg.get(self._key)
+        raw = (self._keg_cfg.get(self.keg_id) or EMPTY_MAPPING).get(self._key)
         if not raw:
             return None
-        try:
-            return date.fromisoformat(str(raw))
-        except Exception:
-            return None
+        return _parse_iso_date(raw if isinstance(raw, str) else str(raw))
 
     async def async_set_value(self, value: date | None) -> None:
         """Store ISO date string in keg_config and persist."""
         domain_state = self._state_ref
-        keg_cfg: Dict[str, Dict[str, Any]] = domain_state.setdefault("keg_config", {})
+        keg_cfg = self._keg_cfg
         cfg = keg_cfg.setdefault(self.keg_id, {})
 
         if value is None:
@@ -131,34 +139,11 @@ class BeerKegDateEntity(DateEntity):
             cfg[self._key] = value.isoformat()
 
         # Mirror into data dict
-        data = domain_state.setdefault("data", {})
-        keg_data = data.setdefault(self.keg_id, {})
+        keg_data = self._data.setdefault(self.keg_id, {})
         keg_data[self._key] = cfg[self._key]
 
-        # Persist with prefs_store
-        prefs_store = domain_state.get("prefs_store")
-        if prefs_store is not None:
-            await prefs_store.async_save(
-                {
-                    "display_units": domain_state.get("display_units", {}),
-                    "keg_config": keg_cfg,
-                }
-            )
-
-        # Nudge sensors/cards
-        self.hass.bus.async_fire(
-            PLATFORM_EVENT,
-            {"keg_id": self.keg_id},
-        )
-        self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        """Refresh when this keg is updated elsewhere."""
-        @callback
-        def _handle_update(event) -> None:
-            if (event.data or {}).get("keg_id") == self.keg_id:
-                self.async_write_ha_state()
+        # Persist with prefs_store (debounced)
+        await domain_state["prefs_debouncer"].async_call()
 
-        self.async_on_remove(
-            self.hass.bus.async_listen(PLATFORM_EVENT, _handle_update)
-        )
+        # Nudge sensors/cards (this entity included, via its keg signal)
+        async_dispatcher_send(self.hass, SIGNAL_KEG_UPDATE.format(self.keg_id))
@@ -0,0 +1,128 @@
+"""Helpers shared by the integration setup and its platforms."""
+from __future__ import annotations
+
+import sys
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Sequence, Set, Tuple
+
+from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import SIGNAL_KEG_UPDATE
+
+# Marks "nothing written yet" where None is a real value
+UNSET: Any = object()
+
+# Allowed display units per kind; the first option is the base/default unit
+DISPLAY_UNIT_OPTIONS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "weight": ("kg", "lb"),
+    "temp": ("°C", "°F"),
+    "pour": ("oz", "ml"),
+})
+
+
+class DisplayUnits(NamedTuple):
+    """Validated display units, cached on the entry state."""
+
+    weight: str
+    temp: str
+    pour: str
+
+
+def validate_display_units(du: Any) -> Dict[str, str]:
+    """Return a full display_units dict; unknown or missing units fall back to the base unit."""
+    if not isinstance(du, Mapping):
+        du = {}
+    clean: Dict[str, str] = {}
+    for kind, options in DISPLAY_UNIT_OPTIONS.items():
+        value = du.get(kind)
+        clean[kind] = value if value in options else options[0]
+    return clean
+
+
+def refresh_display_units_cache(state: Dict[str, Any]) -> DisplayUnits:
+    """Validate state["display_units"] once and cache it as state["display_units_normalized"]."""
+    du = validate_display_units(state.get("display_units"))
+    # Values loaded from prefs/service calls are fresh strings; intern them so
+    # the sensors' comparisons against unit literals hit the identity fast path
+    units = state["display_units_normalized"] = DisplayUnits(
+        sys.intern(du["weight"]), sys.intern(du["temp"]), sys.intern(du["pour"])
+    )
+    return units
+
+
+def prefs_data(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Snapshot of what the prefs store persists (display_units + keg_config).
+
+    Copied so the executor can encode it while entities keep editing the live dicts.
+    """
+    return {
+        "display_units": dict(state.get("display_units", {})),
+        "keg_config": {k: dict(v) for k, v in state.get("keg_config", {}).items()},
+    }
+
+
+def keg_ids_from_event(data: Dict[str, Any] | None) -> Sequence[str]:
+    """Keg ids carried by an update event ({"keg_ids": [...]} or legacy {"keg_id": ...})."""
+    if data is None:
+        return ()
+    keg_ids = data.get("keg_ids")
+    if keg_ids is not None:
+        return keg_ids
+    keg_id = data.get("keg_id")
+    return (keg_id,) if keg_id else ()
+
+
+def new_keg_filter(created: Set[str]) -> Callable[[Dict[str, Any]], bool]:
+    """Bus event_filter passing only update events that name a keg not in created."""
+
+    @callback
+    def _has_new_keg(event_data: Dict[str, Any]) -> bool:
+        keg_ids = keg_ids_from_event(event_data)
+        # issuperset runs the membership checks in C, no generator per event
+        try:
+            if created.issuperset(keg_ids):
+                return False
+        except TypeError:  # unhashable ids in a foreign-fired event
+            return False
+        # Only events naming something new get here; the platform callbacks
+        # build entities from these ids, so reject anything that isn't a str
+        return not isinstance(keg_ids, str) and all(
+            isinstance(keg_id, str) for keg_id in keg_ids
+        )
+
+    return _has_new_keg
+
+
+class KegUpdateMixin:
+    """Per-keg entity that writes state on its keg's update signal, only on change.
+
+    Mix in ahead of the HA entity class; the entity must set self.keg_id.
+    """
+
+    keg_id: str
+    # What the last state write published (see _written_state)
+    _last_written: Any = UNSET
+
+    def _written_state(self) -> Any:
+        """What a state write would publish now; compared against the last write."""
+        return self.native_value
+
+    @callback
+    def _handle_keg_update(self) -> None:
+        """Write state only when _written_state() actually changed."""
+        current = self._written_state()
+        if current == self._last_written:
+            return
+        self._last_written = current
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to this keg's update signal."""
+        # The per-keg signal only reaches this keg's subscribers, unlike a
+        # bus listener that every entity would filter on each update
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_KEG_UPDATE.format(self.keg_id), self._handle_keg_update
+            )
+        )
@@ -9,10 +9,12 @@ from homeassistant.components.number import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING, SIGNAL_KEG_UPDATE
+from .helpers import KegUpdateMixin, keg_ids_from_event, new_keg_filter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -71,6 +73,8 @@ NUMBER_TYPES: Dict[str, Dict[str, Any]] = {
     },
 }
 
+_NUMBER_TYPE_KEYS = tuple(NUMBER_TYPES)
+
 #
 # Global smoothing controls (one per integration entry, not per keg)
 #
@@ -124,40 +128,33 @@ async def async_setup_entry(
     #
     # 2) Per-keg calibration numbers
     #
-    created: Set[str] = state.setdefault("created_number_kegs", set())
-
-    def create_for(keg_id: str) -> None:
-        """Create all number entities for one keg_id (once)."""
-        if keg_id in created:
-            return
-
-        for num_type in NUMBER_TYPES.keys():
-            entities.append(BeerKegNumberEntity(hass, entry, keg_id, num_type))
-
-        created.add(keg_id)
-
-    # Create numbers for any kegs we already know about
-    for keg_id in list(state.get("data", {}).keys()):
-        create_for(keg_id)
-
-    # Add initial batch (global + existing kegs)
+    created: Set[str] = state["created_entities"].setdefault("number", set())
+
+    def create_for(keg_ids) -> None:
+        """Create all number entities for new keg_ids (once), in one batch."""
+        new_ents: List[NumberEntity] = []
+        for keg_id in keg_ids:
+            if keg_id in created:
+                continue
+            for num_type in _NUMBER_TYPE_KEYS:
+                new_ents.append(BeerKegNumberEntity(hass, entry, keg_id, num_type))
+            created.add(keg_id)
+        if new_ents:
+            async_add_entities(new_ents, True)
+
+    # Global numbers, then numbers for any kegs we already know about
     async_add_entities(entities, True)
+    create_for(state["data"])
 
     @callback
     def _on_update(event) -> None:
         """Create entities for new kegs when they appear."""
-        keg_id = (event.data or {}).get("keg_id")
-        if not keg_id or keg_id in created:
-            return
-
-        new_entities: List[NumberEntity] = []
-        for num_type in NUMBER_TYPES.keys():
-            new_entities.append(BeerKegNumberEntity(hass, entry, keg_id, num_type))
-        created.add(keg_id)
-        async_add_entities(new_entities, True)
+        create_for(keg_ids_from_event(event.data))
 
     entry.async_on_unload(
-        hass.bus.async_listen(PLATFORM_EVENT, _on_update)
+        hass.bus.async_listen(
+            PLATFORM_EVENT, _on_update, event_filter=new_keg_filter(created)
+        )
     )
 
 
@@ -175,50 +172,44 @@ class BeerKegGlobalNumberEntity(NumberEntity):
     ) -> None:
         self.hass = hass
         self.entry = entry
+        self._state_ref: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
         self._state_key = meta["state_key"]
         self._default = meta["default"]
 
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_global_{key}"
         self._attr_name = meta["name"]
-        self._attr_mode = meta["mode"]
-        self._attr_native_min_value = meta["min"]
-        self._attr_native_max_value = meta["max"]
-        self._attr_native_step = meta["step"]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Group these under a 'Beer Keg Settings' device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_settings")},
+        # Group these under a 'Beer Keg Settings' device
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_settings")},
             name="Beer Keg Settings",
             manufacturer="Beer Keg",
             model="WebSocket + REST",
         )
+        self._attr_mode = meta["mode"]
+        self._attr_native_min_value = meta["min"]
+        self._attr_native_max_value = meta["max"]
+        self._attr_native_step = meta["step"]
 
     @property
     def native_value(self) -> float | None:
-        domain_state = self.hass.data[DOMAIN][self.entry.entry_id]
-        val = domain_state.get(self._state_key, self._default)
+        val = self._state_ref.get(self._state_key, self._default)
         try:
             return float(val)
         except (TypeError, ValueError):
             return self._default
 
     async def async_set_native_value(self, value: float) -> None:
-        domain_state = self.hass.data[DOMAIN][self.entry.entry_id]
+        domain_state = self._state_ref
         domain_state[self._state_key] = float(value)
 
         # Nudge all kegs so sensors recalc with new smoothing
-        for keg_id in list(domain_state.get("data", {}).keys()):
-            self.hass.bus.async_fire(
-                PLATFORM_EVENT,
-                {"keg_id": keg_id},
-            )
+        for keg_id in domain_state["data"]:
+            async_dispatcher_send(self.hass, SIGNAL_KEG_UPDATE.format(keg_id))
 
         self.async_write_ha_state()
 
 
-class BeerKegNumberEntity(NumberEntity):
+class BeerKegNumberEntity(KegUpdateMixin, NumberEntity):
     """Number entity representing calibration/config values per keg."""
 
     _attr_should_poll = False
@@ -235,6 +226,10 @@ class BeerKegNumberEntity(NumberEntity):
         self.keg_id = keg_id
         self.num_type = num_type
 
+        self._state_ref: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
+        # state["data"] is created once at setup and only mutated in place
+        self._data: Dict[str, Dict[str, Any]] = self._state_ref["data"]
+
         meta = NUMBER_TYPES[num_type]
         self._key = meta["key"]
 
@@ -242,6 +237,13 @@ class BeerKegNumberEntity(NumberEntity):
 
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{keg_id}_{num_type}"
         self._attr_name = f"Keg {short_id} {meta['name']}"
+        # Attach these numbers to the keg device
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_{keg_id}")},
+            name=f"Beer Keg {short_id}",
+            manufacturer="Beer Keg",
+            model="WebSocket + REST",
+        )
         self._attr_mode = meta["mode"]
         self._attr_native_min_value = meta["min"]
         self._attr_native_max_value = meta["max"]
@@ -258,24 +260,10 @@ class BeerKegNumberEntity(NumberEntity):
         else:
             self._attr_native_unit_of_measurement = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Attach these numbers to the keg device."""
-        short_id = self.keg_id[:4]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_{self.keg_id}")},
-            name=f"Beer Keg {short_id}",
-            manufacturer="Beer Keg",
-            model="WebSocket + REST",
-        )
-
     @property
     def native_value(self) -> float | None:
         """Return the current value from integration state."""
-        domain_state = self.hass.data[DOMAIN][self.entry.entry_id]
-        data: Dict[str, Dict[str, Any]] = domain_state.get("data", {})
-        keg = data.get(self.keg_id, {})
-        val = keg.get(self._key)
+        val = (self._data.get(self.keg_id) or EMPTY_MAPPING).get(self._key)
         if val is None:
             return None
         try:
@@ -285,26 +273,8 @@ class BeerKegNumberEntity(NumberEntity):
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the value in integration state (does NOT call REST directly)."""
-        domain_state = self.hass.data[DOMAIN][self.entry.entry_id]
-        data: Dict[str, Dict[str, Any]] = domain_state.setdefault("data", {})
-        keg = data.setdefault(self.keg_id, {})
+        keg = self._data.setdefault(self.keg_id, {})
         keg[self._key] = float(value)
 
-        # Let any listening sensors/cards update
-        self.hass.bus.async_fire(
-            PLATFORM_EVENT,
-            {"keg_id": self.keg_id},
-        )
-        self.async_write_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        """Listen for integration updates and refresh."""
-
-        @callback
-        def _handle_update(event) -> None:
-            if (event.data or {}).get("keg_id") == self.keg_id:
-                self.async_write_ha_state()
-
-        self.async_on_remove(
-            self.hass.bus.async_listen(PLATFORM_EVENT, _handle_update)
-        )
+        # Let this keg's sensors/cards update (this entity included)
+        async_dispatcher_send(self.hass, SIGNAL_KEG_UPDATE.format(self.keg_id))
@@ -7,31 +7,37 @@ from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.dispatcher import (
+    async_dispatcher_connect,
+    async_dispatcher_send,
+)
 from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN
+from .const import DOMAIN, SIGNAL_DISPLAY_UNITS, SIGNAL_KEG_UPDATE
+from .helpers import DISPLAY_UNIT_OPTIONS, refresh_display_units_cache
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORM_EVENT = f"{DOMAIN}_update"
 DEVICES_UPDATE_EVENT = f"{DOMAIN}_devices_update"
 
 # Global unit selects for the integration
 UNIT_SELECTS: Dict[str, Dict[str, Any]] = {
     "weight": {
         "name": "Keg Weight Unit",
-        "options": ["kg", "lb"],
+        "options": list(DISPLAY_UNIT_OPTIONS["weight"]),
     },
     "temp": {
         "name": "Keg Temperature Unit",
-        "options": ["°C", "°F"],
+        "options": list(DISPLAY_UNIT_OPTIONS["temp"]),
     },
     "pour": {
         "name": "Keg Volume Unit",
-        "options": ["oz", "ml"],
+        "options": list(DISPLAY_UNIT_OPTIONS["pour"]),
     },
 }
 
+_UNIT_SELECT_KEYS = tuple(UNIT_SELECTS)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -47,7 +53,7 @@ async def async_setup_entry(
     entities.append(BeerKegDeviceSelect(hass, entry, state))
 
     # 2) Global unit selectors (weight / temp / pour)
-    for unit_kind in UNIT_SELECTS.keys():
+    for unit_kind in _UNIT_SELECT_KEYS:
         entities.append(BeerKegUnitSelect(hass, entry, unit_kind))
 
     async_add_entities(entities, True)
@@ -71,43 +77,39 @@ class BeerKegDeviceSelect(SelectEntity):
         # This will normally become entity_id: select.keg_device
         self._attr_name = "Keg Device"
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_keg_device"
+        # Group this under 'Beer Keg Settings'
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_settings")},
+            name="Beer Keg Settings",
+            manufacturer="Beer Keg",
+            model="WebSocket + REST",
+        )
 
         # store the last selected device in integration state
         if "selected_device" not in self._state_ref:
             self._state_ref["selected_device"] = None
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Group this under 'Beer Keg Settings'."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_settings")},
-            name="Beer Keg Settings",
-            manufacturer="Beer Keg",
-            model="WebSocket + REST",
-        )
+        # Keg device IDs known by the integration; copied only when the
+        # devices list changes
+        self._attr_options = list(self._state_ref.get("devices") or [])
 
     # ---- SelectEntity core ----
 
-    @property
-    def options(self) -> list[str]:
-        """Return list of keg device IDs known by the integration."""
-        devices = self._state_ref.get("devices") or []
-        return list(devices)
-
     @property
     def current_option(self) -> str | None:
         """Current selected keg id."""
+        options = self._attr_options
         selected = self._state_ref.get("selected_device")
-        if selected in self.options:
+        if selected in options:
             return selected
         # Fallback: first option if nothing selected yet
-        if self.options:
-            return self.options[0]
+        if options:
+            return options[0]
         return None
 
     async def async_select_option(self, option: str) -> None:
         """Handle user picking a keg from the dropdown."""
-        if option not in self.options:
+        if option not in self._attr_options:
             _LOGGER.warning("%s: Attempt to select unknown keg device: %s", DOMAIN, option)
             return
 
@@ -120,6 +122,7 @@ class BeerKegDeviceSelect(SelectEntity):
         @callback
         def _handle_devices_update(event) -> None:
             # A devices list update means our options may have changed
+            self._attr_options = list(self._state_ref.get("devices") or [])
             self.async_write_ha_state()
 
         # Listen for /api/kegs/devices updates from __init__.py
@@ -142,46 +145,34 @@ class BeerKegUnitSelect(SelectEntity):
         self.hass = hass
         self.entry = entry
         self._unit_kind = unit_kind  # "weight", "temp", or "pour"
+        self._state_ref: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
 
         meta = UNIT_SELECTS[unit_kind]
+        self._valid_opts = frozenset(DISPLAY_UNIT_OPTIONS[unit_kind])
 
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_unit_{unit_kind}"
         self._attr_name = meta["name"]
-        self._attr_options = meta["options"]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Group unit selects under a shared 'Beer Keg Settings' device."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_settings")},
+        # Group unit selects under a shared 'Beer Keg Settings' device
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_settings")},
             name="Beer Keg Settings",
             manufacturer="Beer Keg",
             model="WebSocket + REST",
         )
+        self._attr_options = meta["options"]
 
     @property
     def current_option(self) -> str | None:
         """Return the currently selected option based on integration state."""
-        domain_state = self.hass.data[DOMAIN][self.entry.entry_id]
-        du = domain_state.get("display_units", {})
-
-        if self._unit_kind == "weight":
-            val = du.get("weight", "kg")
-            return val if val in UNIT_SELECTS["weight"]["options"] else "kg"
-
-        if self._unit_kind == "temp":
-            val = du.get("temp", "°C")
-            return val if val in UNIT_SELECTS["temp"]["options"] else "°C"
-
-        # pour / volume
-        val = du.get("pour", "oz")
-        return val if val in UNIT_SELECTS["pour"]["options"] else "oz"
+        # display_units_normalized is already validated (DisplayUnits fields
+        # are named after the unit kinds)
+        return getattr(self._state_ref["display_units_normalized"], self._unit_kind)
 
     async def async_select_option(self, option: str) -> None:
         """Handle user selecting a new option."""
-        domain_state = self.hass.data[DOMAIN][self.entry.entry_id]
+        domain_state = self._state_ref
 
-        if option not in self._attr_options:
+        if option not in self._valid_opts:
             _LOGGER.warning(
                 "%s: Invalid option '%s' for %s",
                 DOMAIN,
@@ -191,36 +182,24 @@ class BeerKegUnitSelect(SelectEntity):
             return
 
         du = domain_state.setdefault("display_units", {})
+        du[self._unit_kind] = option
 
-        if self._unit_kind == "weight":
-            du["weight"] = option
-        elif self._unit_kind == "temp":
-            du["temp"] = option
-        else:  # pour
-            du["pour"] = option
+        refresh_display_units_cache(domain_state)
 
-        # Persist preferences if prefs_store exists
-        prefs_store = domain_state.get("prefs_store")
-        if prefs_store is not None:
-            await prefs_store.async_save({"display_units": du})
+        # Persist preferences (debounced; keeps keg_config alongside)
+        await domain_state["prefs_debouncer"].async_call()
 
         # Notify all keg sensors so they recalc units
-        for keg_id in list(domain_state.get("data", {}).keys()):
-            self.hass.bus.async_fire(
-                PLATFORM_EVENT,
-                {"keg_id": keg_id},
-            )
+        for keg_id in domain_state["data"]:
+            async_dispatcher_send(self.hass, SIGNAL_KEG_UPDATE.format(keg_id))
 
-        self.async_write_ha_state()
+        # Unit selects (this one included) refresh on the display units signal
+        async_dispatcher_send(self.hass, SIGNAL_DISPLAY_UNITS)
 
     async def async_added_to_hass(self) -> None:
-        """Refresh when integration fires update events."""
-
-        @callback
-        def _handle_update(event) -> None:
-            # If display units change from somewhere else, refresh our select
-            self.async_write_ha_state()
-
+        """Refresh when display units change (here or via set_display_units)."""
         self.async_on_remove(
-            self.hass.bus.async_listen(PLATFORM_EVENT, _handle_update)
+            async_dispatcher_connect(
+                self.hass, SIGNAL_DISPLAY_UNITS, self.async_write_ha_state
+            )
         )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Set
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Set, Tuple
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -9,7 +10,8 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING
+from .helpers import DisplayUnits, KegUpdateMixin, keg_ids_from_event, new_keg_filter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -18,7 +20,7 @@ PLATFORM_EVENT = f"{DOMAIN}_update"
 # Base + display sensor definitions.
 # "unit" here is the *native* unit our integration stores,
 # not necessarily what we want to *display*.
-SENSOR_TYPES: Dict[str, Dict[str, Any]] = {
+SENSOR_TYPES: Mapping[str, Dict[str, Any]] = MappingProxyType({
     # --- RAW BASE SENSORS (HA-native, fixed units) ---
     "weight": {
         "unit": "kg",
@@ -64,15 +66,6 @@ SENSOR_TYPES: Dict[str, Dict[str, Any]] = {
         "device_class": None,
         "state_class": "measurement",
     },
-    # legacy alias
-    "fill_level": {
-        "unit": "%",
-        "name": "Fill Level",
-        "key": "fill_percent",
-        "icon": "mdi:cup",
-        "device_class": None,
-        "state_class": "measurement",
-    },
 
     # --- POUR / CONSUMPTION (base = oz) ---
     "last_pour": {
@@ -135,6 +128,99 @@ SENSOR_TYPES: Dict[str, Dict[str, Any]] = {
         "device_class": None,
         "state_class": None,
     },
+})
+
+# SENSOR_TYPES flattened once at import:
+# (sensor_type, name, key, unit, icon, device_class, state_class)
+SENSOR_SPECS = tuple(
+    (k, m["name"], m["key"], m["unit"], m["icon"], m["device_class"], m["state_class"])
+    for k, m in SENSOR_TYPES.items()
+)
+
+
+# ---- value conversion, one function per sensor type ----
+# Each takes (raw, cached DisplayUnits, base_unit) and returns (value, unit);
+# value is None when raw isn't numeric.
+
+_KG_TO_LB = 2.20462
+_OZ_TO_ML = 29.5735
+_C_TO_F_SCALE = 1.8
+_C_TO_F_OFFSET = 32.0
+
+
+def _to_float(raw: Any) -> float | None:
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return None
+
+
+def _compute_weight(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    """Raw weight: always base kg for HA."""
+    raw_kg = _to_float(raw)
+    if raw_kg is None:
+        return None, None
+    return round(raw_kg, 2), "kg"
+
+
+def _compute_temperature(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    """Raw temperature: always base °C for HA."""
+    raw_c = _to_float(raw)
+    if raw_c is None:
+        return None, None
+    return round(raw_c, 1), "°C"
+
+
+def _compute_weight_display(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    raw_kg = _to_float(raw)
+    if raw_kg is None:
+        return None, None
+    if units.weight == "lb":
+        return round(raw_kg * _KG_TO_LB, 2), "lb"
+    return round(raw_kg, 2), "kg"
+
+
+def _compute_temperature_display(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    raw_c = _to_float(raw)
+    if raw_c is None:
+        return None, None
+    if units.temp == "°F":
+        return round(raw_c * _C_TO_F_SCALE + _C_TO_F_OFFSET, 1), "°F"
+    return round(raw_c, 1), "°C"
+
+
+def _compute_pour_display(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    """last_pour_display / daily_consumption_display: oz or ml."""
+    raw_oz = _to_float(raw)
+    if raw_oz is None:
+        return None, None
+    if units.pour == "ml":
+        return round(raw_oz * _OZ_TO_ML, 0), "ml"
+    return round(raw_oz, 1), "oz"
+
+
+def _compute_pour(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    """Base pour/consumption: always oz; the *_display variants handle ml."""
+    raw_oz = _to_float(raw)
+    if raw_oz is None:
+        return None, None
+    return round(raw_oz, 1), "oz"
+
+
+def _compute_passthrough(raw: Any, units: DisplayUnits, base_unit: str | None) -> Tuple[Any, str | None]:
+    """Remaining fields just return their stored value."""
+    return raw, base_unit
+
+
+_COMPUTE_AND_UNIT: Dict[str, Callable[[Any, DisplayUnits, str | None], Tuple[Any, str | None]]] = {
+    "weight": _compute_weight,
+    "temperature": _compute_temperature,
+    "weight_display": _compute_weight_display,
+    "temperature_display": _compute_temperature_display,
+    "last_pour_display": _compute_pour_display,
+    "daily_consumption_display": _compute_pour_display,
+    "last_pour": _compute_pour,
+    "daily_consumed": _compute_pour,
 }
 
 
@@ -145,36 +231,36 @@ async def async_setup_entry(
 ) -> None:
     """Set up keg sensors for a config entry."""
     state = hass.data[DOMAIN][entry.entry_id]
-    created: Set[str] = state.setdefault("created_kegs", set())
-
-    def create_for(keg_id: str) -> None:
-        # Create all sensors (raw + display) for one keg_id (once).
-        if keg_id in created:
-            return
-
-        ents: List[KegSensor] = [
-            KegSensor(hass, entry, keg_id, sensor_key)
-            for sensor_key in SENSOR_TYPES.keys()
-        ]
-        async_add_entities(ents, True)
-        created.add(keg_id)
+    created: Set[str] = state["created_entities"].setdefault("sensor", set())
+
+    def create_for(keg_ids) -> None:
+        # Create all sensors (raw + display) for each new keg_id, in one batch.
+        ents: List[KegSensor] = []
+        for keg_id in keg_ids:
+            if keg_id in created:
+                continue
+            ents.extend(KegSensor(hass, entry, keg_id, *spec) for spec in SENSOR_SPECS)
+            created.add(keg_id)
+        if ents:
+            async_add_entities(ents, True)
 
     # create for any already-known kegs
-    for keg_id in list(state.get("data", {}).keys()):
-        create_for(keg_id)
+    create_for(state["data"])
 
     @callback
     def _on_update(event) -> None:
         """Handle keg update events from the integration."""
-        keg_id = (event.data or {}).get("keg_id")
-        if keg_id:
-            create_for(keg_id)
-            # existing sensors for this keg will also be nudged by their own listeners
+        create_for(keg_ids_from_event(event.data))
+        # existing sensors for these kegs are nudged through their keg signal
 
-    entry.async_on_unload(hass.bus.async_listen(PLATFORM_EVENT, _on_update))
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            PLATFORM_EVENT, _on_update, event_filter=new_keg_filter(created)
+        )
+    )
 
 
-class KegSensor(SensorEntity):
+class KegSensor(KegUpdateMixin, SensorEntity):
     """One logical sensor (weight/temp/etc.) for a specific keg."""
 
     _attr_should_poll = False
@@ -185,6 +271,12 @@ class KegSensor(SensorEntity):
         entry: ConfigEntry,
         keg_id: str,
         sensor_type: str,
+        name: str,
+        key: str,
+        unit: str | None,
+        icon: str | None,
+        device_class: str | None,
+        state_class: str | None,
     ) -> None:
         self.hass = hass
         self.entry = entry
@@ -192,161 +284,45 @@ class KegSensor(SensorEntity):
         self.sensor_type = sensor_type
 
         self._state_ref: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
-        self._meta = SENSOR_TYPES[sensor_type]
+        # state["data"] is created once at setup and only mutated in place
+        self._data: Dict[str, Dict[str, Any]] = self._state_ref["data"]
+        self._key = key
+        self._unit = unit
+        self._compute = _COMPUTE_AND_UNIT.get(sensor_type, _compute_passthrough)
 
         # Shorten keg id in name for cosmetics
         short_id = keg_id[:4]
 
-        self._attr_name = f"Keg {short_id} {self._meta['name']}"
+        self._attr_name = f"Keg {short_id} {name}"
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{keg_id}_{sensor_type}"
-        self._attr_icon = self._meta.get("icon")
-        self._attr_device_class = self._meta.get("device_class")
-        self._attr_state_class = self._meta.get("state_class")
-        # Start with base unit; display units may adjust this in native_value
-        self._attr_native_unit_of_measurement = self._meta.get("unit")
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        short_id = self.keg_id[:4]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_{self.keg_id}")},
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_{keg_id}")},
             name=f"Beer Keg {short_id}",
             manufacturer="Beer Keg",
             model="WebSocket + REST",
         )
-
-    # ---- helpers ----
-
-    def _get_display_units(self) -> Dict[str, str]:
-        """Return normalized display units dict from integration state."""
-        du = self._state_ref.get("display_units") or {}
-        weight_u = du.get("weight", "kg")
-        temp_u = du.get("temp", "°C")
-        pour_u = du.get("pour", "oz")
-
-        if weight_u not in ("kg", "lb"):
-            weight_u = "kg"
-        if temp_u not in ("°C", "°F"):
-            temp_u = "°C"
-        if pour_u not in ("oz", "ml"):
-            pour_u = "oz"
-
-        return {"weight": weight_u, "temp": temp_u, "pour": pour_u}
+        self._attr_icon = icon
+        self._attr_device_class = device_class
+        self._attr_state_class = state_class
+        # Start with base unit; display units may adjust this in native_value
+        self._attr_native_unit_of_measurement = unit
 
     # ---- core value ----
 
     @property
     def native_value(self) -> Any:
         """Return value, converted according to Beer Keg display units."""
-        data: Dict[str, Dict[str, Any]] = self._state_ref.get("data", {})
-        raw = data.get(self.keg_id, {}).get(self._meta["key"])
+        raw = (self._data.get(self.keg_id) or EMPTY_MAPPING).get(self._key)
 
         if raw is None:
             return None
 
-        units = self._get_display_units()
-
-        # ========== RAW FIXED-UNIT SENSORS ==========
-        if self.sensor_type == "weight":
-            # Always base kg for HA
-            try:
-                raw_kg = float(raw)
-            except (TypeError, ValueError):
-                return None
-            self._attr_native_unit_of_measurement = "kg"
-            return round(raw_kg, 2)
-
-        if self.sensor_type == "temperature":
-            # Always base °C for HA
-            try:
-                raw_c = float(raw)
-            except (TypeError, ValueError):
-                return None
-            self._attr_native_unit_of_measurement = "°C"
-            return round(raw_c, 1)
-
-        # ========== DISPLAY SENSORS (follow display_units) ==========
-
-        # ---- DISPLAY weight ----
-        if self.sensor_type == "weight_display":
-            try:
-                raw_kg = float(raw)
-            except (TypeError, ValueError):
-                return None
-
-            if units["weight"] == "lb":
-                self._attr_native_unit_of_measurement = "lb"
-                return round(raw_kg * 2.20462, 2)
-            else:
-                self._attr_native_unit_of_measurement = "kg"
-                return round(raw_kg, 2)
-
-        # ---- DISPLAY temperature ----
-        if self.sensor_type == "temperature_display":
-            try:
-                raw_c = float(raw)
-            except (TypeError, ValueError):
-                return None
-
-            if units["temp"] == "°F":
-                self._attr_native_unit_of_measurement = "°F"
-                return round((raw_c * 9.0 / 5.0) + 32.0, 1)
-            else:
-                self._attr_native_unit_of_measurement = "°C"
-                return round(raw_c, 1)
-
-        # ---- DISPLAY pour: last_pour_display ----
-        if self.sensor_type == "last_pour_display":
-            try:
-                raw_oz = float(raw)
-            except (TypeError, ValueError):
-                return None
-
-            if units["pour"] == "ml":
-                self._attr_native_unit_of_measurement = "ml"
-                return round(raw_oz * 29.5735, 0)
-            else:
-                self._attr_native_unit_of_measurement = "oz"
-                return round(raw_oz, 1)
-
-        # ---- DISPLAY pour: daily_consumption_display ----
-        if self.sensor_type == "daily_consumption_display":
-            try:
-                raw_oz = float(raw)
-            except (TypeError, ValueError):
-                return None
-
-            if units["pour"] == "ml":
-                self._attr_native_unit_of_measurement = "ml"
-                return round(raw_oz * 29.5735, 0)
-            else:
-                self._attr_native_unit_of_measurement = "oz"
-                return round(raw_oz, 1)
-
-        # ========== BASE POUR / OTHER META (no dynamic conversion here) ==========
-
-        if self.sensor_type in ("last_pour", "daily_consumed"):
-            # always stay in oz here; display_* variants handle ml.
-            try:
-                raw_oz = float(raw)
-            except (TypeError, ValueError):
-                return None
-            self._attr_native_unit_of_measurement = "oz"
-            return round(raw_oz, 1)
-
-        # all remaining fields just return their stored value
-        self._attr_native_unit_of_measurement = self._meta.get("unit")
-        return raw
-
-    async def async_added_to_hass(self) -> None:
-        """Subscribe to integration update events for this keg."""
-        self.async_on_remove(
-            self.hass.bus.async_listen(PLATFORM_EVENT, self._refresh_if_mine)
-        )
+        value, unit = self._compute(raw, self._state_ref["display_units_normalized"], self._unit)
+        if value is None:
+            return None
+        self._attr_native_unit_of_measurement = unit
+        return value
 
-    @callback
-    def _refresh_if_mine(self, event) -> None:
-        """Refresh state when our keg_id gets an update event."""
-        if (event.data or {}).get("keg_id") == self.keg_id:
-            # Recompute native_value + native_unit_of_measurement
-            self.async_write_ha_state()
+    def _written_state(self) -> Tuple[Any, str | None]:
+        """(value, unit); native_value also refreshes native_unit_of_measurement."""
+        return (self.native_value, self._attr_native_unit_of_measurement)
@@ -3,13 +3,15 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Set
 
-from homeassistant.components.text import TextEntity
+from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import DOMAIN, EMPTY_MAPPING, SIGNAL_KEG_UPDATE
+from .helpers import UNSET, KegUpdateMixin, keg_ids_from_event, new_keg_filter
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +42,11 @@ TEXT_TYPES: Dict[str, Dict[str, Any]] = {
     },
 }
 
+# TEXT_TYPES flattened once at import: (text_type, key, name, min, max)
+TEXT_SPECS = tuple(
+    (k, m["key"], m["name"], m["min"], m["max"]) for k, m in TEXT_TYPES.items()
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -48,43 +55,40 @@ async def async_setup_entry(
 ) -> None:
     """Set up per-keg text entities (name / SG / OG)."""
     state = hass.data[DOMAIN][entry.entry_id]
-    created: Set[str] = state.setdefault("created_text_kegs", set())
-
-    entities: List[TextEntity] = []
-
-    def create_for(keg_id: str) -> None:
-        if keg_id in created:
-            return
-        for text_type in TEXT_TYPES.keys():
-            entities.append(BeerKegTextEntity(hass, entry, keg_id, text_type))
-        created.add(keg_id)
+    created: Set[str] = state["created_entities"].setdefault("text", set())
+
+    def create_for(keg_ids) -> None:
+        # All new kegs in one update event are added in a single batch
+        new_ents: List[TextEntity] = []
+        for keg_id in keg_ids:
+            if keg_id in created:
+                continue
+            for spec in TEXT_SPECS:
+                new_ents.append(BeerKegTextEntity(hass, entry, keg_id, *spec))
+            created.add(keg_id)
+        if new_ents:
+            async_add_entities(new_ents, True)
 
     # Existing kegs
-    for keg_id in list(state.get("data", {}).keys()):
-        create_for(keg_id)
-
-    async_add_entities(entities, True)
+    create_for(state["data"])
 
     @callback
     def _on_update(event) -> None:
         """Create entities when new kegs appear."""
-        keg_id = (event.data or {}).get("keg_id")
-        if keg_id and keg_id not in created:
-            new_ents: List[TextEntity] = []
-            for text_type in TEXT_TYPES.keys():
-                new_ents.append(BeerKegTextEntity(hass, entry, keg_id, text_type))
-            created.add(keg_id)
-            async_add_entities(new_ents, True)
+        create_for(keg_ids_from_event(event.data))
 
     entry.async_on_unload(
-        hass.bus.async_listen(PLATFORM_EVENT, _on_update)
+        hass.bus.async_listen(
+            PLATFORM_EVENT, _on_update, event_filter=new_keg_filter(created)
+        )
     )
 
 
-class BeerKegTextEntity(TextEntity):
+class BeerKegTextEntity(KegUpdateMixin, TextEntity):
     """Per-keg text entity backed by integration state + prefs_store."""
 
     _attr_should_poll = False
+    _attr_mode = TextMode.TEXT
 
     def __init__(
         self,
@@ -92,46 +96,54 @@ class BeerKegTextEntity(TextEntity):
         entry: ConfigEntry,
         keg_id: str,
         text_type: str,
+        key: str,
+        name: str,
+        min_len: int,
+        max_len: int,
     ) -> None:
-        self.hass = hass
-        self.entry = entry
         self.keg_id = keg_id
-        self.text_type = text_type
 
         self._state_ref: Dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
-        meta = TEXT_TYPES[text_type]
-        self._key = meta["key"]
+        # state["data"] / state["keg_config"] are settled before platform
+        # setup and only mutated in place afterwards
+        self._data: Dict[str, Dict[str, Any]] = self._state_ref["data"]
+        self._keg_cfg: Dict[str, Dict[str, Any]] = self._state_ref["keg_config"]
+        self._key = key
+        # "name" in data is owned by the backend (rewritten on every frame) and
+        # native_value prefers keg_config for it, so only SG/OG are mirrored
+        # into data, where the per-keg number entities read them
+        self._mirror_to_data = key != "name"
 
         short_id = keg_id[:4]
 
         self._attr_unique_id = f"{DOMAIN}_{entry.entry_id}_{keg_id}_text_{text_type}"
-        self._attr_name = f"Keg {short_id} {meta['name']}"
-        self._attr_mode = "text"
-        self._attr_min = meta["min"]
-        self._attr_max = meta["max"]
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        short_id = self.keg_id[:4]
-        return DeviceInfo(
-            identifiers={(DOMAIN, f"{self.entry.entry_id}_{self.keg_id}")},
+        self._attr_name = f"Keg {short_id} {name}"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, f"{entry.entry_id}_{keg_id}")},
             name=f"Beer Keg {short_id}",
             manufacturer="Beer Keg",
             model="WebSocket + REST",
         )
+        self._attr_min = min_len
+        self._attr_max = max_len
 
     @property
     def native_value(self) -> str | None:
-        """Return current text from keg_config (prefs), falling back to data."""
-        domain_state = self._state_ref
-        keg_cfg: Dict[str, Dict[str, Any]] = domain_state.setdefault("keg_config", {})
-        cfg = keg_cfg.get(self.keg_id, {})
+        """Return current text; recomputed only after a keg update."""
+        # The last written value doubles as the cache
+        if self._last_written is UNSET:
+            self._last_written = self._compute_value()
+        return self._last_written
+
+    def _compute_value(self) -> str | None:
+        """Current text from keg_config (prefs), falling back to data."""
+        cfg = self._keg_cfg.get(self.keg_id) or EMPTY_MAPPING
 
         if self._key == "name":
             # name: prefer config; fall back to live data; else keg_id
             if "name" in cfg and cfg["name"]:
                 return str(cfg["name"])
-            data = domain_state.get("data", {}).get(self.keg_id, {})
+            data = self._data.get(self.keg_id) or EMPTY_MAPPING
             if data.get("name"):
                 return str(data["name"])
             return self.keg_id
@@ -145,48 +157,34 @@ class BeerKegTextEntity(TextEntity):
     async def async_set_value(self, value: str) -> None:
         """Update config, persist via prefs_store, and nudge sensors."""
         domain_state = self._state_ref
-        keg_cfg: Dict[str, Dict[str, Any]] = domain_state.setdefault("keg_config", {})
-        cfg = keg_cfg.setdefault(self.keg_id, {})
+        cfg = self._keg_cfg.setdefault(self.keg_id, {})
 
         # Simple bounds trimming
-        meta = TEXT_TYPES[self.text_type]
+        max_len = self._attr_max
         if value is None:
             value = ""
         value = str(value)
-        if meta["max"] and len(value) > meta["max"]:
-            value = value[: meta["max"]]
+        if max_len and len(value) > max_len:
+            value = value[:max_len]
+
+        mirror = self._mirror_to_data
+        if cfg.get(self._key) == value and (
+            not mirror or (self._data.get(self.keg_id) or EMPTY_MAPPING).get(self._key) == value
+        ):
+            # Resubmitted unchanged value: nothing to persist or announce
+            return
 
         cfg[self._key] = value
 
-        # Mirror into data dict for convenience
-        data = domain_state.setdefault("data", {})
-        keg_data = data.setdefault(self.keg_id, {})
-        keg_data[self._key] = value
-
-        # Persist (along with display_units)
-        prefs_store = domain_state.get("prefs_store")
-        if prefs_store is not None:
-            await prefs_store.async_save(
-                {
-                    "display_units": domain_state.get("display_units", {}),
-                    "keg_config": keg_cfg,
-                }
-            )
-
-        # Nudge sensors/cards
-        self.hass.bus.async_fire(
-            PLATFORM_EVENT,
-            {"keg_id": self.keg_id},
-        )
-        self.async_write_ha_state()
+        if mirror:
+            self._data.setdefault(self.keg_id, {})[self._key] = value
 
-    async def async_added_to_hass(self) -> None:
-        """Refresh when this keg is updated elsewhere."""
-        @callback
-        def _handle_update(event) -> None:
-            if (event.data or {}).get("keg_id") == self.keg_id:
-                self.async_write_ha_state()
+        # Persist (along with display_units; debounced)
+        await domain_state["prefs_debouncer"].async_call()
 
-        self.async_on_remove(
-            self.hass.bus.async_listen(PLATFORM_EVENT, _handle_update)
-        )
+        # Nudge sensors/cards (this entity included, via its keg signal)
+        async_dispatcher_send(self.hass, SIGNAL_KEG_UPDATE.format(self.keg_id))
+
+    def _written_state(self) -> str | None:
+        """Recompute the value (bypassing the cache) for the change check."""
+        return self._compute_value()